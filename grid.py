@@ -1,5 +1,6 @@
 from __future__ import annotations
-from layer_store import SetLayerStore
+from layer_store import SetLayerStore, AdditiveLayerStore, SequenceLayerStore
+from data_structures.referential_array import ArrayR
 
 
 class Grid:
@@ -31,7 +32,24 @@ class Grid:
         self.width = x
         self.height = y
         self.brush_size = self.DEFAULT_BRUSH_SIZE
-        
+
+        if draw_style == self.DRAW_STYLE_SET:
+            store_type = SetLayerStore
+        elif draw_style == self.DRAW_STYLE_ADD:
+            store_type = AdditiveLayerStore
+        elif draw_style == self.DRAW_STYLE_SEQUENCE:
+            store_type = SequenceLayerStore
+        else:
+            raise ValueError(f"Unknown draw style: {draw_style}")
+
+        # Indexed as grid[x][y], one LayerStore per square.
+        self.grid = ArrayR(x)
+        for i in range(x):
+            column = ArrayR(y)
+            for j in range(y):
+                column[j] = store_type()
+            self.grid[i] = column
+
 
     def __getitem__(self, index):
         return self.grid[index]
@@ -62,4 +80,6 @@ class Grid:
         """
         Activate the special affect on all grid squares.
         """
-        
\ No newline at end of file
+        for column in self.grid:
+            for store in column:
+                store.special()
@@ -1,12 +1,16 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from layer_util import Layer
+from layer_util import Layer, get_layers
 from data_structures.queue_adt import CircularQueue
-from data_structures.set_adt import Set
+from data_structures.bset import BSet
+from data_structures.array_sorted_list import ArraySortedList
+from data_structures.sorted_list_adt import ListItem
 
 
 class LayerStore(ABC):
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
         
@@ -48,6 +52,8 @@ class SetLayerStore(LayerStore):
     - erase: Remove the single layer. Ignore what is currently selected.
     - special: Invert the colour output.
     """
+    __slots__ = ("layer", "special_mode")
+
     def __init__(self):
         super().__init__()
         self.layer = None
@@ -60,6 +66,8 @@ class SetLayerStore(LayerStore):
         return False
     
     def erase(self, layer: Layer) -> bool:
+        if self.layer is None:
+            return False
         self.layer = None
         return True
         
@@ -74,8 +82,9 @@ class SetLayerStore(LayerStore):
         else:
             return start 
 
-        if self.special_mode == True:
-            color = tuple(255 - c for c in color)
+        if self.special_mode:
+            r, g, b = color
+            return 255 - r, 255 - g, 255 - b
 
         return color 
 
@@ -86,47 +95,50 @@ class AdditiveLayerStore(LayerStore):
     - erase: Remove the first layer that was added. Ignore what is currently selected.
     - special: Reverse the order of current layers (first becomes last, etc.)
     """
-    def __init__(self, max_layers: int) -> None:
+    __slots__ = ("layers", "_apply_list")
+
+    MAX_LAYERS = 100
+
+    def __init__(self, max_layers: int = MAX_LAYERS) -> None:
         super().__init__()
-        self.layers = CircularQueue(capacity)
+        self.layers = CircularQueue(max_layers)
+        # Each queued layer's apply function, front first, so the colour path
+        # iterates a plain list and skips the attribute lookup per layer.
+        self._apply_list = []
     
     def add(self, layer: Layer) -> bool:
         if self.layers.is_full():
             return False
         self.layers.append(layer)
+        self._apply_list.append(layer.apply)
         return True
     
     def get_color(self, start, timestamp, x, y) -> tuple[int, int, int]:
-        r, g, b, a = 0, 0, 0, 0
-
-        for layer in self.layers:
-            if layer.start <= start and layer.end >= timestamp:
-                pixel = layer.get_pixel(start, timestamp, x, y)
-                r += pixel[0]
-                g += pixel[1]
-                b += pixel[2]
-                a += pixel[3]
-
-        if a == 0:
-            return 0, 0, 0
-        else:
-            r, g, b = r // a, g // a, b // a
-            return r, g, b
+        applies = self._apply_list
+        # Most squares hold zero or one layer; skip the fold for those.
+        if not applies:
+            return start
+        if len(applies) == 1:
+            return applies[0](start, timestamp, x, y)
+        color = start
+        for apply in applies:
+            color = apply(color, timestamp, x, y)
+        return color
     
     def erase(self, layer: Layer) -> bool:
         if self.layers.is_empty():
             return False
-        layer == self.layers.serve()
+        self.layers.serve()
+        del self._apply_list[0]
         return True
         
     def special(self):
         layers = []
         while not self.layers.is_empty():
             layers.append(self.layers.serve())
-            layers.reverse()
-         
-        for layer in layers:
+        for layer in reversed(layers):
             self.layers.append(layer)
+        self._apply_list.reverse()
 
 class SequenceLayerStore(LayerStore):
     """
@@ -137,28 +149,60 @@ class SequenceLayerStore(LayerStore):
         Of all currently applied layers, remove the one with median `name`.
         In the event of two layers being the median names, pick the lexicographically smaller one.
     """
+    __slots__ = ("applied_layers", "_applied", "_applied_mask", "_by_name")
+
     def __init__(self) -> None:
         super().__init__()
-        self.applied_layers = set()
+        # Bit (index + 1) is set for each applied layer type.
+        self.applied_layers = BSet()
+        # Apply functions of the applied layers in index order, and the bit
+        # set they were built from. Rebuilt lazily by get_color once the bits
+        # differ, so add/erase churn that ends in the same state costs nothing.
+        self._applied = []
+        self._applied_mask = 0
+        # Applied layers keyed by name, kept sorted so the median is a lookup.
+        self._by_name = ArraySortedList(len(get_layers()))
+
+    def _rebuild_applied(self) -> None:
+        """
+        Refresh the ordered list of applied layers from the bit set.
+        Only set bits are visited, lowest index first.
+        """
+        registry = get_layers()
+        applied = []
+        mask = self._applied_mask = self.applied_layers.elems
+        while mask:
+            bit = mask & -mask
+            applied.append(registry[bit.bit_length() - 1].apply)
+            mask ^= bit
+        self._applied = applied
 
     def add(self, layer: Layer) -> bool:
-        if layer.name not in self.applied_layers:
-            self.applied_layers.add(layer.name)
+        if layer.index + 1 not in self.applied_layers:
+            self.applied_layers.add(layer.index + 1)
+            self._by_name.add(ListItem(layer, layer.name))
             return True
         else:
             return False
 
     def get_color(self, start, timestamp, x, y) -> tuple[int, int, int]:
+        if self._applied_mask != self.applied_layers.elems:
+            self._rebuild_applied()
         color = start
-        for layer in self.applied_layers:
-            if layer.name in self.applied_layers:
-                color = layer.apply(start, timestamp, x, y, color)
+        for apply in self._applied:
+            color = apply(color, timestamp, x, y)
         return color
 
     def erase(self, layer: Layer) -> bool:
-        self.applied_layers.remove(layer.name)
+        if layer.index + 1 not in self.applied_layers:
+            return False
+        self.applied_layers.remove(layer.index + 1)
+        self._by_name.remove(ListItem(layer, layer.name))
         return True
 
     def special(self):
-        median_name = sorted(self.applied_layers)[len(self.applied_layers) // 2]
-        self.applied_layers.remove(median_name)
\ No newline at end of file
+        if self._by_name.is_empty():
+            return
+        # Lower median, so ties go to the lexicographically smaller name.
+        median = self._by_name.delete_at_index((len(self._by_name) - 1) // 2).value
+        self.applied_layers.remove(median.index + 1)
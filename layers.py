@@ -8,10 +8,8 @@ from layer_util import background, register
 @register
 @background(200, 0, 120)
 def rainbow(color, timestamp, x, y):
-    return tuple(
-        int(255*x)
-        for x in colorsys.hls_to_rgb((timestamp/20 + x/20 + y/20)%1, 0.6, 0.6)
-    )
+    r, g, b = colorsys.hls_to_rgb((timestamp/20 + x/20 + y/20)%1, 0.6, 0.6)
+    return (int(255*r), int(255*g), int(255*b))
 
 @register
 @background(170, 170, 170)
@@ -21,18 +19,14 @@ def black(color, timestamp, x, y):
 @register
 @background(240, 240, 240)
 def lighten(color, timestamp, x, y):
-    return tuple(
-        min(255, x + 40)
-        for x in color
-    )
+    r, g, b = color
+    return (min(255, r + 40), min(255, g + 40), min(255, b + 40))
 
 @register
 @background(0, 255, 255)
 def invert(color, timestamp, x, y):
-    return tuple(
-        255 - c
-        for c in color
-    )
+    r, g, b = color
+    return (255 - r, 255 - g, 255 - b)
 
 @register
 @background(255, 0, 0)
@@ -68,7 +62,5 @@ def sparkle(color, timestamp, x, y):
 @register
 @background(30, 30, 30)
 def darken(color, timestamp, x, y):
-    return tuple(
-        max(0, x - 40)
-        for x in color
-    )
+    r, g, b = color
+    return (max(0, r - 40), max(0, g - 40), max(0, b - 40))
@@ -121,14 +121,17 @@ class MyWindow(arcade.Window):
         # UI - Draw Modes / Action buttons
         self.action_buttons.draw()
         # Grid
+        # One immutable background for the whole frame, rather than a fresh list copy per square.
+        bg = tuple(self.BG)
         for x in range(self.GRID_SIZE_X):
+            column = self.grid[x]
             for y in range(self.GRID_SIZE_Y):
                 arcade.draw_lrtb_rectangle_filled(
                     self.GRID_SQ_WIDTH * x,
                     self.GRID_SQ_WIDTH * (x+1),
                     self.GRID_SQ_HEIGHT * (y+1),
                     self.GRID_SQ_HEIGHT * y,
-                    self.grid[x][y].get_color(self.BG[:], self.timestamp, x, y),
+                    column[y].get_color(bg, self.timestamp, x, y),
                 )
 
     def on_mouse_press(self, x: int, y: int, button: int, modifiers: int) -> None:
@@ -62,3 +62,15 @@ class TestAddLayer(unittest.TestCase):
         s.erase(black)
         s.add(invert)
         self.assertEqual(s.get_color((100, 100, 100), 7, 0, 0), (255-91, 255-214, 255-104))
+
+    @number("2.6")
+    def test_special_order(self):
+        s = AdditiveLayerStore()
+        s.add(lighten)
+        s.add(invert)
+        s.add(black)
+        s.special() # Ordering: Black, Invert, Lighten.
+        self.assertEqual(s.get_color((100, 100, 100), 7, 0, 0), (255, 255, 255))
+        # Black is now first, so it is the one erased.
+        s.erase(lighten)
+        self.assertEqual(s.get_color((100, 100, 100), 7, 0, 0), (195, 195, 195))